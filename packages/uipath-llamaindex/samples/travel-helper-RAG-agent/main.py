@@ -1,5 +1,6 @@
+import asyncio
 import json
-import time
+import os
 
 from llama_index.core import get_response_synthesizer
 from llama_index.core.agent import ReActAgent
@@ -25,6 +26,57 @@ company_policy_files_directory = "sample_data/company_policies"
 personal_preferences_files_directory = "sample_data/personal_preferences"
 
 llm = UiPathOpenAI()
+# Shared by every index upload, ingestion check and query engine
+uipath = UiPath()
+
+
+# Static prompt bodies, only the per-run fields are filled in with str.format
+sub_questions_prompt_template = """\
+You are a specialized AI travel recommendation agent working exclusively for corporate travel purposes.
+You have access to the company's allowed travel budget, and optionally, individual employee preference data for their trips.
+Your goal is to provide professional, efficient, and optimized travel recommendations while ensuring compliance with company policies.
+
+For each request, perform the following:
+1. Summarize the travel information you gathered from the input (destination, dates, employee preferences, company budget, etc.).
+2. Propose an actionable recommendation, such as booking tickets, reservations, or scheduling itineraries, ensuring alignment with the budget and preferences.
+
+Output relevant sub-questions, such that the answers to all the
+sub-questions put together will answer the question. Respond
+in pure JSON without any markdown, like this:
+{{
+    "sub_questions": [
+        "What is the allowed expense budget for Amsterdam?",
+        "What are the user's preferences?",
+    ]
+}}
+Here is the user query: {query}
+
+And here is the list of tools: {tools}
+"""
+
+combine_answers_prompt_template = """\
+You are given an overall question that has been split into sub-questions,
+each of which has been answered. Combine the answers to all the sub-questions
+into a single answer to the original question.
+Your response should include the following sections:
+---
+**Travel Summary:**
+- Destination(s):
+- Travel Dates:
+- Allowed Budget:
+- Employee Preferences:
+
+**Recommendations:**
+- Suggested actions (e.g., purchase tickets for X flights, book accommodations, etc.)
+- Any important notes regarding budget or policy constraints.
+---
+Be concise yet comprehensive in your response.
+
+Original query: {query}
+
+Sub-questions and answers:
+{answers}
+"""
 
 
 class CustomStartEvent(StartEvent):
@@ -69,12 +121,14 @@ def generate_context_grounding_query_engine_tools(
         index_name=company_policy_index_name,
         folder_path=index_folder_path,
         response_synthesizer=response_synthesizer,
+        uipath=uipath,
     )
 
     query_engine_personal_preferences = ContextGroundingQueryEngine(
         index_name=personal_preferences_index_name,
         folder_path=index_folder_path,
         response_synthesizer=response_synthesizer,
+        uipath=uipath,
     )
 
     return [
@@ -99,7 +153,6 @@ async def in_progress_ingestion(index_name: str) -> bool:
     """
     returns True if ingestion finished and was successful, False otherwise
     """
-    uipath = UiPath()
     index = await uipath.context_grounding.retrieve_async(
         index_name, folder_path=index_folder_path
     )
@@ -107,6 +160,17 @@ async def in_progress_ingestion(index_name: str) -> bool:
 
 
 class SubQuestionQueryEngine(Workflow):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Build the query engine tools and the ReAct agent once and reuse them
+        # for every sub-question instead of recreating them per event
+        self._query_engine_tools = generate_context_grounding_query_engine_tools(
+            response_mode=ResponseMode.SIMPLE_SUMMARIZE
+        )
+        self._react_agent = ReActAgent(
+            tools=self._query_engine_tools, llm=llm, verbose=True
+        )
+
     @step
     async def workflow_entrypoint(
         self, ctx: Context, ev: CustomStartEvent
@@ -120,7 +184,6 @@ class SubQuestionQueryEngine(Workflow):
     @step
     async def add_data_to_index(self, ev: AddDataToIndexEvent) -> WaitForIndexIngestion:
         async def add_file_to_index(file_path, index_name, ingest_data):
-            uipath = UiPath()
             await uipath.context_grounding.add_to_index_async(
                 name=index_name,
                 folder_path=index_folder_path,
@@ -129,33 +192,28 @@ class SubQuestionQueryEngine(Workflow):
                 ingest_data=ingest_data,
             )
 
-        try:
-            import os
-
-            company_policy_files = os.listdir(company_policy_files_directory)
-            for i in range(len(company_policy_files)):
-                ingest_data = i == len(company_policy_files) - 1
+        async def add_directory_to_index(directory, index_name):
+            # Files of one index are added in order so that only the last one
+            # triggers ingestion
+            files = os.listdir(directory)
+            for i, file_name in enumerate(files):
                 await add_file_to_index(
-                    os.path.join(
-                        company_policy_files_directory, company_policy_files[i]
-                    ),
-                    company_policy_index_name,
-                    ingest_data,
+                    os.path.join(directory, file_name),
+                    index_name,
+                    ingest_data=i == len(files) - 1,
                 )
 
-            personal_preferences_files = os.listdir(
-                personal_preferences_files_directory
-            )
-            for i in range(len(personal_preferences_files)):
-                ingest_data = i == len(personal_preferences_files) - 1
-                await add_file_to_index(
-                    os.path.join(
-                        personal_preferences_files_directory,
-                        personal_preferences_files[i],
-                    ),
+        try:
+            # The two indexes are independent, upload them concurrently
+            await asyncio.gather(
+                add_directory_to_index(
+                    company_policy_files_directory, company_policy_index_name
+                ),
+                add_directory_to_index(
+                    personal_preferences_files_directory,
                     personal_preferences_index_name,
-                    ingest_data,
-                )
+                ),
+            )
             return WaitForIndexIngestion()
 
         except Exception as e:
@@ -170,31 +228,42 @@ class SubQuestionQueryEngine(Workflow):
         Since ReAct agents can't handle well 'uipath.platform.errors.IngestionInProgressException', we use this node to make sure the data added to indexes was successfully ingested,
         before moving to 'create_sub_questions_plan' step
         """
-        no_of_tries = 10
+
+        async def is_ingested(index_name, already_ingested):
+            return already_ingested or not await in_progress_ingestion(index_name)
+
         wait_seconds = 10
+        max_wait_seconds = 30
+        # stay below the workflow timeout so the OutputEvent below is reachable
+        max_total_wait_seconds = 60
+        total_waited_seconds = 0.0
         ingested_company_policy_index = ingested_personal_preferences_index = False
-        while no_of_tries:
-            should_continue = False
-            if not ingested_company_policy_index:
-                should_continue = True
-                ingested_company_policy_index = not await in_progress_ingestion(
-                    company_policy_index_name
-                )
-            if not ingested_personal_preferences_index:
-                should_continue = True
-                ingested_personal_preferences_index = not await in_progress_ingestion(
-                    personal_preferences_index_name
-                )
-            if not should_continue:
+        while True:
+            (
+                ingested_company_policy_index,
+                ingested_personal_preferences_index,
+            ) = await asyncio.gather(
+                is_ingested(company_policy_index_name, ingested_company_policy_index),
+                is_ingested(
+                    personal_preferences_index_name,
+                    ingested_personal_preferences_index,
+                ),
+            )
+            if ingested_company_policy_index and ingested_personal_preferences_index:
+                break
+            remaining_seconds = max_total_wait_seconds - total_waited_seconds
+            if remaining_seconds <= 0:
                 break
             # wait and retry
-            no_of_tries -= 1
+            wait_seconds = min(wait_seconds, remaining_seconds)
             print(
-                "Waiting for index ingestion... Retrying "
-                + str(no_of_tries)
-                + " more time(s)"
+                "Waiting for index ingestion... Retrying in "
+                + str(wait_seconds)
+                + " second(s)"
             )
-            time.sleep(wait_seconds)
+            await asyncio.sleep(wait_seconds)
+            total_waited_seconds += wait_seconds
+            wait_seconds = min(wait_seconds * 1.5, max_wait_seconds)
         if ingested_company_policy_index and ingested_personal_preferences_index:
             return QueryEvent()
         return OutputEvent(
@@ -205,39 +274,18 @@ class SubQuestionQueryEngine(Workflow):
     async def create_sub_questions_plan(
         self, ctx: Context, ev: QueryEvent
     ) -> SubQuestionEvent:
-        query_engine_tools = generate_context_grounding_query_engine_tools(
-            response_mode=ResponseMode.SIMPLE_SUMMARIZE
-        )
-
-        response = llm.complete(
-            f"""
-            You are a specialized AI travel recommendation agent working exclusively for corporate travel purposes.
-            You have access to the company's allowed travel budget, and optionally, individual employee preference data for their trips.
-            Your goal is to provide professional, efficient, and optimized travel recommendations while ensuring compliance with company policies.
-
-            For each request, perform the following:
-            1. Summarize the travel information you gathered from the input (destination, dates, employee preferences, company budget, etc.).
-            2. Propose an actionable recommendation, such as booking tickets, reservations, or scheduling itineraries, ensuring alignment with the budget and preferences.
-
-            Output relevant sub-questions, such that the answers to all the
-            sub-questions put together will answer the question. Respond
-            in pure JSON without any markdown, like this:
-            {{
-                "sub_questions": [
-                    "What is the allowed expense budget for Amsterdam?",
-                    "What are the user's preferences?",
-                ]
-            }}
-            Here is the user query: {await ctx.store.get("original_query")}
-
-            And here is the list of tools: {query_engine_tools}
-            """
+        response = await llm.acomplete(
+            sub_questions_prompt_template.format(
+                query=await ctx.store.get("original_query"),
+                tools=self._query_engine_tools,
+            )
         )
 
         print(f"Sub-questions are {response}")
 
         response_obj = json.loads(str(response))
-        sub_questions = response_obj["sub_questions"]
+        # The LLM may repeat a sub-question, answer each distinct one only once
+        sub_questions = list(dict.fromkeys(response_obj["sub_questions"]))
 
         await ctx.store.set("sub_question_count", len(sub_questions))
 
@@ -250,13 +298,7 @@ class SubQuestionQueryEngine(Workflow):
     async def handle_sub_question(self, ev: SubQuestionEvent) -> AnswerEvent:
         print(f"Sub-question is {ev.question}")
 
-        # Recreate tools here instead of retrieving from context
-        query_engine_tools = generate_context_grounding_query_engine_tools(
-            response_mode=ResponseMode.SIMPLE_SUMMARIZE
-        )
-
-        react_agent = ReActAgent(tools=query_engine_tools, llm=llm, verbose=True)
-        response = await react_agent.run(user_msg=ev.question)
+        response = await self._react_agent.run(user_msg=ev.question)
 
         return AnswerEvent(question=ev.question, answer=str(response))
 
@@ -277,33 +319,13 @@ class SubQuestionQueryEngine(Workflow):
             ]
         )
 
-        prompt = f"""
-            You are given an overall question that has been split into sub-questions,
-            each of which has been answered. Combine the answers to all the sub-questions
-            into a single answer to the original question.
-            Your response should include the following sections:
-            ---
-            **Travel Summary:**
-            - Destination(s):
-            - Travel Dates:
-            - Allowed Budget:
-            - Employee Preferences:
-
-            **Recommendations:**
-            - Suggested actions (e.g., purchase tickets for X flights, book accommodations, etc.)
-            - Any important notes regarding budget or policy constraints.
-            ---
-            Be concise yet comprehensive in your response.
-
-            Original query: {await ctx.store.get("original_query")}
-
-            Sub-questions and answers:
-            {answers}
-        """
+        prompt = combine_answers_prompt_template.format(
+            query=await ctx.store.get("original_query"), answers=answers
+        )
 
         print(f"Final prompt is {prompt}")
 
-        response = llm.complete(prompt)
+        response = await llm.acomplete(prompt)
 
         print("Final response is", response)
 
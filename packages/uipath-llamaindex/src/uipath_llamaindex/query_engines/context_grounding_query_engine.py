@@ -36,5 +36,5 @@ class ContextGroundingQueryEngine(CustomQueryEngine):
 
     async def acustom_query(self, query_str: str):
         nodes = await self._retriever.aretrieve(query_str)
-        response_obj = self._response_synthesizer.synthesize(query_str, nodes)
+        response_obj = await self._response_synthesizer.asynthesize(query_str, nodes)
         return response_obj
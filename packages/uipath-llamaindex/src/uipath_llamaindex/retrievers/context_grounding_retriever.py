@@ -47,15 +47,17 @@ class ContextGroundingRetriever(BaseRetriever):
         return self._to_nodes_with_scores()
 
     def _to_nodes_with_scores(self) -> list[NodeWithScore]:
-        nodes_with_scores = []
-        for chunk in self._results:
-            node = TextNode(
-                text=chunk.content,
-                metadata={
-                    "source_document_id": chunk.source_document_id,
-                    "source": chunk.source,
-                    "page_number": chunk.page_number,
-                },
+        return [
+            NodeWithScore(
+                node=TextNode(
+                    text=chunk.content,
+                    metadata={
+                        "source_document_id": chunk.source_document_id,
+                        "source": chunk.source,
+                        "page_number": chunk.page_number,
+                    },
+                ),
+                score=chunk.score,
             )
-            nodes_with_scores.append(NodeWithScore(node=node, score=chunk.score))
-        return nodes_with_scores
+            for chunk in self._results
+        ]
@@ -186,5 +186,7 @@ class AsyncSqlite:
 
         await self.conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
         await self.conn.execute("PRAGMA synchronous=NORMAL")
-        await self.conn.execute("PRAGMA cache_size=10000")
+        # Negative cache_size is in KiB (64 MB page cache)
+        await self.conn.execute("PRAGMA cache_size=-64000")
         await self.conn.execute("PRAGMA temp_store=MEMORY")
+        await self.conn.execute("PRAGMA mmap_size=268435456")
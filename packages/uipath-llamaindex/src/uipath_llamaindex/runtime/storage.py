@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import os
 import pickle
-from typing import Any, cast
+from typing import Any, Callable, cast
 
+import msgpack
+import orjson
 from pydantic import BaseModel
 from uipath.core.errors import ErrorCategory, UiPathFaultedTriggerError
 from uipath.runtime import (
@@ -18,6 +20,53 @@ from uipath.runtime import (
 
 from ._sqlite import AsyncSqlite
 
+_INVALID_VALUE_TYPE_MSG = "Value must be str, dict, BaseModel or None."
+
+# msgpack integers are limited to 64 bits, larger ones are stored as their
+# decimal digits in this extension type.
+_BIG_INT_EXT_TYPE = 1
+
+
+def _pack_default(obj: Any) -> Any:
+    """Encode values msgpack can't pack natively."""
+    if isinstance(obj, int):
+        return msgpack.ExtType(_BIG_INT_EXT_TYPE, str(obj).encode())
+    raise TypeError(f"Cannot serialize {type(obj).__name__} value")
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    """Decode the extension types written by _pack_default."""
+    if code == _BIG_INT_EXT_TYPE:
+        return int(data)
+    return msgpack.ExtType(code, data)
+
+
+# Reused for every key-value entry instead of building a Packer per packb call.
+_MSGPACK_PACKER = msgpack.Packer(default=_pack_default)
+
+
+def _pack_value(value: Any) -> bytes:
+    """Serialize a value to a msgpack key-value entry."""
+    return b"m:" + _MSGPACK_PACKER.pack(value)
+
+
+# Encoders for key-value entries, keyed by exact value type.
+_VALUE_DUMPERS: dict[type, Callable[[Any], str | bytes | None]] = {
+    str: lambda value: "s:" + value,
+    dict: _pack_value,
+    type(None): lambda value: None,
+}
+
+# Decoders for stored key-value entries, keyed by their two-character prefix.
+# "j:" is kept for JSON values written before the switch to msgpack.
+_VALUE_LOADERS: dict[str | bytes, Callable[[Any], Any]] = {
+    "s:": lambda raw: raw[2:],
+    "j:": lambda raw: json.loads(raw[2:]),
+    b"m:": lambda raw: msgpack.unpackb(
+        raw[2:], strict_map_key=False, ext_hook=_unpack_ext
+    ),
+}
+
 
 class SqliteResumableStorage:
     """SQLite database storage for resume triggers and workflow context."""
@@ -95,7 +144,7 @@ class SqliteResumableStorage:
                     runtime_id TEXT NOT NULL,
                     namespace TEXT NOT NULL,
                     key TEXT NOT NULL,
-                    value TEXT,
+                    value BLOB,
                     timestamp DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'utc')),
                     PRIMARY KEY (runtime_id, namespace, key)
                 )
@@ -112,6 +161,10 @@ class SqliteResumableStorage:
     ) -> None:
         """Save resume trigger to SQLite database."""
         try:
+            # Serialize before touching the database so nothing can fail
+            # between the delete and the insert
+            rows = [self._serialize_trigger_row(runtime_id, t) for t in triggers]
+
             db = await self._get_db()
 
             # Delete all existing triggers for this runtime_id
@@ -123,16 +176,11 @@ class SqliteResumableStorage:
                 (runtime_id,),
             )
 
-            # Insert new triggers
-            for trigger in triggers:
-                trigger_dict = self._serialize_trigger(trigger)
-                trigger_json = json.dumps(trigger_dict)
-                await db.execute(
-                    "INSERT INTO resume_triggers (runtime_id, interrupt_id, trigger_data) VALUES (?, ?, ?)",
-                    (runtime_id, trigger.interrupt_id, trigger_json),
-                )
-
-            await db.commit()
+            # Insert new triggers in the same transaction (executemany commits)
+            await db.executemany(
+                "INSERT INTO resume_triggers (runtime_id, interrupt_id, trigger_data) VALUES (?, ?, ?)",
+                rows,
+            )
         except Exception as exc:
             msg = f"Failed to save resume triggers to database {self.storage_path!r}: {exc}"
             raise UiPathFaultedTriggerError(ErrorCategory.SYSTEM, msg) from exc
@@ -154,7 +202,7 @@ class SqliteResumableStorage:
 
         triggers = []
         for row in rows:
-            trigger_dict = json.loads(row[0])
+            trigger_dict = orjson.loads(row[0])
             triggers.append(self._deserialize_trigger(trigger_dict))
         return triggers
 
@@ -235,15 +283,7 @@ class SqliteResumableStorage:
         value: Any,
     ) -> None:
         """Save arbitrary key-value pair to database."""
-        if not (
-            isinstance(value, str)
-            or isinstance(value, dict)
-            or isinstance(value, BaseModel)
-            or value is None
-        ):
-            raise TypeError("Value must be str, dict, BaseModel or None.")
-
-        value_text = self._dump_value(value)
+        value_data = self._dump_value(value)
 
         db = await self._get_db()
         await db.execute(
@@ -255,7 +295,7 @@ class SqliteResumableStorage:
                 value = excluded.value,
                 timestamp = (strftime('%Y-%m-%d %H:%M:%S', 'now', 'utc'))
             """,
-            (runtime_id, namespace, key, value_text),
+            (runtime_id, namespace, key, value_data),
         )
         await db.commit()
 
@@ -275,7 +315,14 @@ class SqliteResumableStorage:
         if not row:
             return None
 
-        return self._load_value(cast(str | None, row[0]))
+        return self._load_value(cast(str | bytes | None, row[0]))
+
+    def _serialize_trigger_row(
+        self, runtime_id: str, trigger: UiPathResumeTrigger
+    ) -> tuple[str, str | None, str]:
+        """Serialize a resume trigger to a resume_triggers row."""
+        trigger_json = orjson.dumps(self._serialize_trigger(trigger)).decode()
+        return (runtime_id, trigger.interrupt_id, trigger_json)
 
     def _serialize_trigger(self, trigger: UiPathResumeTrigger) -> dict[str, Any]:
         """Serialize a resume trigger to a dictionary."""
@@ -327,20 +374,25 @@ class SqliteResumableStorage:
 
         return resume_trigger
 
-    def _dump_value(self, value: str | dict[str, Any] | BaseModel | None) -> str | None:
-        if value is None:
-            return None
+    def _dump_value(
+        self, value: str | dict[str, Any] | BaseModel | None
+    ) -> str | bytes | None:
+        dumper = _VALUE_DUMPERS.get(type(value))
+        if dumper is not None:
+            return dumper(value)
+        # Slow path for subclasses (including every BaseModel)
         if isinstance(value, BaseModel):
-            return "j:" + json.dumps(value.model_dump())
+            return _pack_value(value.model_dump(mode="json"))
         if isinstance(value, dict):
-            return "j:" + json.dumps(value)
-        return "s:" + value
+            return _pack_value(value)
+        if isinstance(value, str):
+            return "s:" + value
+        raise TypeError(_INVALID_VALUE_TYPE_MSG)
 
-    def _load_value(self, raw: str | None) -> Any:
+    def _load_value(self, raw: str | bytes | None) -> Any:
         if raw is None:
             return None
-        if raw.startswith("s:"):
-            return raw[2:]
-        if raw.startswith("j:"):
-            return json.loads(raw[2:])
-        return raw
+        loader = _VALUE_LOADERS.get(raw[:2])
+        if loader is None:
+            return raw
+        return loader(raw)
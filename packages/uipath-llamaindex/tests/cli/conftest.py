@@ -7,7 +7,7 @@ TESTS_DIR = Path(__file__).parent.parent
 MOCKS_DIR = TESTS_DIR / "mocks"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_script_basic_config() -> str:
     mock_file = MOCKS_DIR / "simple_script_basic_config.py"
     with open(mock_file, "r") as file:
@@ -15,7 +15,7 @@ def simple_script_basic_config() -> str:
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_script_custom_config() -> str:
     mock_file = MOCKS_DIR / "simple_script_custom_config.py"
     with open(mock_file, "r") as file:
@@ -23,7 +23,7 @@ def simple_script_custom_config() -> str:
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llama_config() -> str:
     mock_file = MOCKS_DIR / "llama_index.json"
     with open(mock_file, "r") as file:
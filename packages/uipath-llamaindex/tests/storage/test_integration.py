@@ -2,8 +2,6 @@
 
 import asyncio
 import json
-import os
-import tempfile
 from typing import Any
 
 import pytest
@@ -31,17 +29,9 @@ class TestIntegrationScenarios:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_full_workflow_lifecycle(self, storage: SqliteResumableStorage):
@@ -191,17 +181,9 @@ class TestEdgeCases:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_very_large_context(self, storage: SqliteResumableStorage):
@@ -410,17 +392,9 @@ class TestDataConsistency:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_concurrent_reads(self, storage: SqliteResumableStorage):
@@ -1,12 +1,12 @@
 """Tests for SqliteResumableStorage class."""
 
+import asyncio
 import json
-import os
-import tempfile
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
+import msgpack
 import pytest
 from pydantic import BaseModel
 from uipath.runtime import (
@@ -100,17 +100,9 @@ class TestTriggerOperations:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_save_trigger_basic(self, storage: SqliteResumableStorage):
@@ -179,8 +171,9 @@ class TestTriggerOperations:
         retrieved = await storage.get_triggers("runtime-3")
         assert retrieved is not None
         assert retrieved[0] is not None
-        # Payload should be JSON string after serialization/deserialization
-        assert retrieved[0].payload is not None
+        # Payload should be JSON string after serialization/deserialization,
+        # in the same format json.dumps produces
+        assert retrieved[0].payload == json.dumps(payload_dict)
 
     @pytest.mark.asyncio
     async def test_save_trigger_with_none_payload(
@@ -262,11 +255,15 @@ class TestTriggerOperations:
             interrupt_id="interrupt-2",
         )
 
-        await storage.save_triggers("runtime-a", [trigger1])
-        await storage.save_triggers("runtime-b", [trigger2])
+        await asyncio.gather(
+            storage.save_triggers("runtime-a", [trigger1]),
+            storage.save_triggers("runtime-b", [trigger2]),
+        )
 
-        retrieved_a = await storage.get_triggers("runtime-a")
-        retrieved_b = await storage.get_triggers("runtime-b")
+        retrieved_a, retrieved_b = await asyncio.gather(
+            storage.get_triggers("runtime-a"),
+            storage.get_triggers("runtime-b"),
+        )
         assert retrieved_a is not None
         assert retrieved_b is not None
         assert retrieved_a[0] is not None
@@ -280,17 +277,9 @@ class TestContextOperations:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_save_and_load_context_basic(self, storage: SqliteResumableStorage):
@@ -357,11 +346,15 @@ class TestContextOperations:
         context_a = {"runtime": "a", "value": 100}
         context_b = {"runtime": "b", "value": 200}
 
-        await storage.save_context("runtime-a", context_a)
-        await storage.save_context("runtime-b", context_b)
+        await asyncio.gather(
+            storage.save_context("runtime-a", context_a),
+            storage.save_context("runtime-b", context_b),
+        )
 
-        loaded_a = await storage.load_context("runtime-a")
-        loaded_b = await storage.load_context("runtime-b")
+        loaded_a, loaded_b = await asyncio.gather(
+            storage.load_context("runtime-a"),
+            storage.load_context("runtime-b"),
+        )
 
         assert loaded_a == context_a
         assert loaded_b == context_b
@@ -372,17 +365,9 @@ class TestKeyValueOperations:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     @pytest.mark.asyncio
     async def test_set_and_get_string_value(self, storage: SqliteResumableStorage):
@@ -402,6 +387,31 @@ class TestKeyValueOperations:
         value = await storage.get_value("runtime-2", "namespace2", "key2")
         assert value == test_dict
 
+    @pytest.mark.asyncio
+    async def test_set_and_get_dict_with_large_int(
+        self, storage: SqliteResumableStorage
+    ):
+        """Test that ints beyond 64 bits round-trip exactly."""
+        test_dict = {"big": 2**70 + 1, "small": -(2**70) - 1, 1: 2**70, 3: [2**64]}
+
+        await storage.set_value("runtime-2", "namespace2", "big", test_dict)
+
+        value = await storage.get_value("runtime-2", "namespace2", "big")
+        assert value == test_dict
+        assert isinstance(value["big"], int)
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_dict_with_int_keys(
+        self, storage: SqliteResumableStorage
+    ):
+        """Test that non-string dict keys keep their type."""
+        test_dict = {1: "one", 2: "two"}
+
+        await storage.set_value("runtime-2", "namespace2", "int-keys", test_dict)
+
+        value = await storage.get_value("runtime-2", "namespace2", "int-keys")
+        assert value == {1: "one", 2: "two"}
+
     @pytest.mark.asyncio
     async def test_set_and_get_pydantic_model(self, storage: SqliteResumableStorage):
         """Test setting and getting a Pydantic model."""
@@ -448,14 +458,37 @@ class TestKeyValueOperations:
         value = await storage.get_value("nonexistent", "namespace", "key")
         assert value is None
 
+    @pytest.mark.asyncio
+    async def test_get_value_legacy_json(self, storage: SqliteResumableStorage):
+        """Test reading a JSON value written by earlier versions."""
+        db = await storage._get_db()
+        await db.execute(
+            "INSERT INTO runtime_kv (runtime_id, namespace, key, value) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                "runtime-7",
+                "namespace7",
+                "key7",
+                "j:" + json.dumps({"nan": float("nan"), "big": 2**70 + 1}),
+            ),
+        )
+
+        value = await storage.get_value("runtime-7", "namespace7", "key7")
+        assert value["nan"] != value["nan"]
+        assert value["big"] == 2**70 + 1
+
     @pytest.mark.asyncio
     async def test_values_isolated_by_runtime_id(self, storage: SqliteResumableStorage):
         """Test that values are isolated by runtime_id."""
-        await storage.set_value("runtime-a", "ns", "key", "value-a")
-        await storage.set_value("runtime-b", "ns", "key", "value-b")
+        await asyncio.gather(
+            storage.set_value("runtime-a", "ns", "key", "value-a"),
+            storage.set_value("runtime-b", "ns", "key", "value-b"),
+        )
 
-        value_a = await storage.get_value("runtime-a", "ns", "key")
-        value_b = await storage.get_value("runtime-b", "ns", "key")
+        value_a, value_b = await asyncio.gather(
+            storage.get_value("runtime-a", "ns", "key"),
+            storage.get_value("runtime-b", "ns", "key"),
+        )
 
         assert value_a == "value-a"
         assert value_b == "value-b"
@@ -463,11 +496,15 @@ class TestKeyValueOperations:
     @pytest.mark.asyncio
     async def test_values_isolated_by_namespace(self, storage: SqliteResumableStorage):
         """Test that values are isolated by namespace."""
-        await storage.set_value("runtime-1", "ns-a", "key", "value-a")
-        await storage.set_value("runtime-1", "ns-b", "key", "value-b")
+        await asyncio.gather(
+            storage.set_value("runtime-1", "ns-a", "key", "value-a"),
+            storage.set_value("runtime-1", "ns-b", "key", "value-b"),
+        )
 
-        value_a = await storage.get_value("runtime-1", "ns-a", "key")
-        value_b = await storage.get_value("runtime-1", "ns-b", "key")
+        value_a, value_b = await asyncio.gather(
+            storage.get_value("runtime-1", "ns-a", "key"),
+            storage.get_value("runtime-1", "ns-b", "key"),
+        )
 
         assert value_a == "value-a"
         assert value_b == "value-b"
@@ -475,11 +512,15 @@ class TestKeyValueOperations:
     @pytest.mark.asyncio
     async def test_values_isolated_by_key(self, storage: SqliteResumableStorage):
         """Test that values are isolated by key."""
-        await storage.set_value("runtime-1", "ns", "key-a", "value-a")
-        await storage.set_value("runtime-1", "ns", "key-b", "value-b")
+        await asyncio.gather(
+            storage.set_value("runtime-1", "ns", "key-a", "value-a"),
+            storage.set_value("runtime-1", "ns", "key-b", "value-b"),
+        )
 
-        value_a = await storage.get_value("runtime-1", "ns", "key-a")
-        value_b = await storage.get_value("runtime-1", "ns", "key-b")
+        value_a, value_b = await asyncio.gather(
+            storage.get_value("runtime-1", "ns", "key-a"),
+            storage.get_value("runtime-1", "ns", "key-b"),
+        )
 
         assert value_a == "value-a"
         assert value_b == "value-b"
@@ -490,17 +531,9 @@ class TestSerializationMethods:
 
     @pytest.fixture
     async def storage(self):
-        """Create a SqliteResumableStorage instance with temporary database file."""
-        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        temp_db.close()
-
-        try:
-            async with SqliteResumableStorage(str(temp_db.name)) as storage:
-                await storage.setup()
-                yield storage
-        finally:
-            if os.path.exists(temp_db.name):
-                os.remove(temp_db.name)
+        """Create a SqliteResumableStorage instance with an in-memory database."""
+        async with SqliteResumableStorage(":memory:") as storage:
+            yield storage
 
     def test_serialize_trigger_queue_type(self, storage: SqliteResumableStorage):
         """Test serialization of queue type trigger."""
@@ -588,13 +621,17 @@ class TestSerializationMethods:
     def test_dump_value_dict(self, storage: SqliteResumableStorage):
         """Test _dump_value with dictionary."""
         result = storage._dump_value({"key": "value"})
-        assert result == 'j:{"key": "value"}'
+        assert isinstance(result, bytes)
+        assert result.startswith(b"m:")
+        assert msgpack.unpackb(result[2:]) == {"key": "value"}
 
     def test_dump_value_pydantic_model(self, storage: SqliteResumableStorage):
         """Test _dump_value with Pydantic model."""
         model = SampleModel(name="test", value=42)
         result = storage._dump_value(model)
-        assert result == 'j:{"name": "test", "value": 42}'
+        assert isinstance(result, bytes)
+        assert result.startswith(b"m:")
+        assert msgpack.unpackb(result[2:]) == {"name": "test", "value": 42}
 
     def test_dump_value_none(self, storage: SqliteResumableStorage):
         """Test _dump_value with None."""
@@ -606,6 +643,11 @@ class TestSerializationMethods:
         result = storage._load_value("s:test string")
         assert result == "test string"
 
+    def test_load_value_msgpack(self, storage: SqliteResumableStorage):
+        """Test _load_value with msgpack bytes."""
+        result = storage._load_value(b"m:" + msgpack.packb({"key": "value"}))
+        assert result == {"key": "value"}
+
     def test_load_value_json(self, storage: SqliteResumableStorage):
         """Test _load_value with JSON."""
         result = storage._load_value('j:{"key": "value"}')
@@ -643,8 +685,6 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_multiple_concurrent_operations(self, tmp_path: Path):
         """Test that multiple concurrent operations work correctly."""
-        import asyncio
-
         db_path = tmp_path / "test.db"
         storage = SqliteResumableStorage(str(db_path))
         await storage.setup()
@@ -9,7 +9,7 @@ TESTS_DIR = Path(__file__).parent.parent
 MOCKS_DIR = TESTS_DIR / "mocks"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_agent_basic() -> str:
     """Load simple agent with basic configuration."""
     mock_file = MOCKS_DIR / "simple_agent_basic.py"
@@ -18,7 +18,7 @@ def simple_agent_basic() -> str:
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_agent_translation() -> str:
     """Load simple agent with translation configuration."""
     mock_file = MOCKS_DIR / "simple_agent_translation.py"
@@ -27,7 +27,7 @@ def simple_agent_translation() -> str:
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def openai_agents_config() -> str:
     """Load openai_agents.json configuration."""
     mock_file = MOCKS_DIR / "openai_agents.json"
@@ -1,9 +1,27 @@
+import os
 import tempfile
 from typing import Generator
 
 import pytest
 from click.testing import CliRunner
 
+MOCK_UIPATH_ENV = {
+    "UIPATH_URL": "https://mock.uipath.com",
+    "UIPATH_ORGANIZATION_ID": "mock-org-id",
+    "UIPATH_TENANT_ID": "mock-tenant-id",
+    "UIPATH_ACCESS_TOKEN": "mock-token",
+}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mock_uipath_env() -> Generator[None, None, None]:
+    """Provide mock UiPath environment variables for the whole test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in MOCK_UIPATH_ENV.items():
+            if name not in os.environ:
+                mp.setenv(name, value)
+        yield
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -1,14 +1,10 @@
 """Tests for agent-as-tools sample schema extraction."""
 
-import os
 import sys
 from pathlib import Path
+from typing import Any
 
-# Set up mock environment variables for sample imports
-os.environ.setdefault("UIPATH_URL", "https://mock.uipath.com")
-os.environ.setdefault("UIPATH_ORGANIZATION_ID", "mock-org-id")
-os.environ.setdefault("UIPATH_TENANT_ID", "mock-tenant-id")
-os.environ.setdefault("UIPATH_ACCESS_TOKEN", "mock-token")
+import pytest
 
 # Add samples directory to path
 samples_dir = Path(__file__).parent.parent / "samples" / "agent-as-tools"
@@ -22,11 +18,14 @@ from main import (  # type: ignore  # noqa: E402
 from uipath_openai_agents.runtime.schema import get_entrypoints_schema  # noqa: E402
 
 
-def test_agent_as_tools_input_schema():
-    """Test that input schema uses default messages format (OpenAI Agents pattern)."""
-    orchestrator_agent = main()
-    schema = get_entrypoints_schema(orchestrator_agent)
+@pytest.fixture(scope="module")
+def schema() -> dict[str, Any]:
+    """Entrypoints schema of the orchestrator agent, shared by the read-only tests."""
+    return get_entrypoints_schema(main())
+
 
+def test_agent_as_tools_input_schema(schema: dict[str, Any]):
+    """Test that input schema uses default messages format (OpenAI Agents pattern)."""
     # Verify input schema structure - should use default messages
     assert "input" in schema
     assert "properties" in schema["input"]
@@ -46,11 +45,8 @@ def test_agent_as_tools_input_schema():
     assert "messages" in schema["input"]["required"]
 
 
-def test_agent_as_tools_output_schema():
+def test_agent_as_tools_output_schema(schema: dict[str, Any]):
     """Test that output schema is extracted from agent's output_type."""
-    orchestrator_agent = main()
-    schema = get_entrypoints_schema(orchestrator_agent)
-
     # Verify output schema structure
     assert "output" in schema
     assert "properties" in schema["output"]
@@ -78,11 +74,8 @@ def test_agent_as_tools_output_schema():
     assert "languages_used" in schema["output"]["required"]
 
 
-def test_agent_as_tools_schema_metadata():
+def test_agent_as_tools_schema_metadata(schema: dict[str, Any]):
     """Test that schema includes model metadata from agent's output_type."""
-    orchestrator_agent = main()
-    schema = get_entrypoints_schema(orchestrator_agent)
-
     # Input uses default messages format (no custom title/description)
     assert "input" in schema
     assert "properties" in schema["input"]
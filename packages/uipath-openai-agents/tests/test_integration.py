@@ -1,17 +1,10 @@
 """Integration test demonstrating new runtime features."""
 
-import os
 import sys
 from pathlib import Path
 
 import pytest
 
-# Set up mock environment variables for sample imports
-os.environ.setdefault("UIPATH_URL", "https://mock.uipath.com")
-os.environ.setdefault("UIPATH_ORGANIZATION_ID", "mock-org-id")
-os.environ.setdefault("UIPATH_TENANT_ID", "mock-tenant-id")
-os.environ.setdefault("UIPATH_ACCESS_TOKEN", "mock-token")
-
 # Add samples directory to path
 samples_dir = Path(__file__).parent.parent / "samples" / "agent-as-tools"
 sys.path.insert(0, str(samples_dir))
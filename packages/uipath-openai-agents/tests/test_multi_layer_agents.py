@@ -1,16 +1,16 @@
 """Tests for multi-layer OpenAI agents with handoffs and tools."""
 
-import os
+from collections import Counter
 
+import pytest
 from agents import Agent, function_tool
+from uipath.runtime.schema import (
+    UiPathRuntimeEdge,
+    UiPathRuntimeGraph,
+    UiPathRuntimeNode,
+)
 
-# Set up mock environment variables
-os.environ.setdefault("UIPATH_URL", "https://mock.uipath.com")
-os.environ.setdefault("UIPATH_ORGANIZATION_ID", "mock-org-id")
-os.environ.setdefault("UIPATH_TENANT_ID", "mock-tenant-id")
-os.environ.setdefault("UIPATH_ACCESS_TOKEN", "mock-token")
-
-from uipath_openai_agents.runtime.schema import (  # noqa: E402
+from uipath_openai_agents.runtime.schema import (
     get_agent_schema,
     get_entrypoints_schema,
 )
@@ -167,16 +167,91 @@ def create_multi_layer_agent():
     return orchestrator_agent
 
 
+# ============= EXPECTATIONS =============
+
+EXPECTED_NODE_TYPES = [
+    # Control nodes
+    ("__start__", "__start__"),
+    ("__end__", "__end__"),
+    # Agent nodes
+    ("orchestrator_agent", "node"),
+    ("hr_agent", "node"),
+    ("procurement_agent", "node"),
+    ("policy_agent", "node"),
+    # Aggregated tools nodes
+    ("hr_agent_tools", "tool"),
+    ("procurement_agent_tools", "tool"),
+    ("policy_agent_tools", "tool"),
+]
+
+EXPECTED_EDGES = [
+    # Bidirectional handoff edges without labels
+    ("orchestrator_agent", "hr_agent", None),
+    ("hr_agent", "orchestrator_agent", None),
+    ("orchestrator_agent", "procurement_agent", None),
+    ("procurement_agent", "orchestrator_agent", None),
+    ("orchestrator_agent", "policy_agent", None),
+    ("policy_agent", "orchestrator_agent", None),
+    # Bidirectional edges to/from aggregated tools nodes without labels
+    ("hr_agent", "hr_agent_tools", None),
+    ("hr_agent_tools", "hr_agent", None),
+    ("procurement_agent", "procurement_agent_tools", None),
+    ("procurement_agent_tools", "procurement_agent", None),
+    ("policy_agent", "policy_agent_tools", None),
+    ("policy_agent_tools", "policy_agent", None),
+    # Control flow edges
+    ("__start__", "orchestrator_agent", "input"),
+    ("orchestrator_agent", "__end__", "output"),
+]
+
+EXPECTED_TOOL_NAMES = [
+    (
+        "hr_agent_tools",
+        ["check_employee_benefits", "submit_leave_request", "get_salary_info"],
+    ),
+    (
+        "procurement_agent_tools",
+        ["create_purchase_order", "check_budget_availability", "track_order_status"],
+    ),
+    ("policy_agent_tools", ["get_company_policy", "check_compliance_status"]),
+]
+
+
+# ============= FIXTURES =============
+
+
+class IndexedGraph:
+    """Agent graph with nodes and edges indexed once for O(1) lookups."""
+
+    def __init__(self, graph: UiPathRuntimeGraph):
+        self.nodes: list[UiPathRuntimeNode] = graph.nodes
+        self.edges: list[UiPathRuntimeEdge] = graph.edges
+        self.node_by_id: dict[str, UiPathRuntimeNode] = {
+            node.id: node for node in graph.nodes
+        }
+        self.edge_set: frozenset[tuple[str, str, str | None]] = frozenset(
+            (edge.source, edge.target, edge.label) for edge in graph.edges
+        )
+
+
+@pytest.fixture(scope="session")
+def multi_layer_agent() -> Agent:
+    """Build the multi-layer agent once per test session (and xdist worker)."""
+    return create_multi_layer_agent()
+
+
+@pytest.fixture(scope="session")
+def graph(multi_layer_agent: Agent) -> IndexedGraph:
+    """Extract and index the agent graph once per test session (and xdist worker)."""
+    return IndexedGraph(get_agent_schema(multi_layer_agent))
+
+
 # ============= TESTS =============
 
 
-def test_multi_layer_agent_graph_nodes():
+def test_multi_layer_agent_graph_nodes(graph: IndexedGraph):
     """Test that all agents and aggregated tools nodes are represented in the graph."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
-    # Get all node IDs
-    node_ids = {node.id for node in graph.nodes}
+    node_ids = graph.node_by_id
 
     # Verify control nodes
     assert "__start__" in node_ids
@@ -197,92 +272,29 @@ def test_multi_layer_agent_graph_nodes():
     assert len(graph.nodes) == 9
 
 
-def test_multi_layer_agent_node_types():
+@pytest.mark.parametrize(("node_id", "expected_type"), EXPECTED_NODE_TYPES)
+def test_multi_layer_agent_node_types(
+    graph: IndexedGraph, node_id: str, expected_type: str
+):
     """Test that nodes have correct types."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
-    # Create a mapping of node ID to type
-    node_types = {node.id: node.type for node in graph.nodes}
-
-    # Verify control node types
-    assert node_types["__start__"] == "__start__"
-    assert node_types["__end__"] == "__end__"
-
-    # Verify agent nodes are of type "node"
-    assert node_types["orchestrator_agent"] == "node"
-    assert node_types["hr_agent"] == "node"
-    assert node_types["procurement_agent"] == "node"
-    assert node_types["policy_agent"] == "node"
-
-    # Verify aggregated tools nodes are of type "tool"
-    assert node_types["hr_agent_tools"] == "tool"
-    assert node_types["procurement_agent_tools"] == "tool"
-    assert node_types["policy_agent_tools"] == "tool"
-
-
-def test_multi_layer_agent_handoff_edges():
-    """Test that handoff edges are correctly created between orchestrator and specialized agents without labels."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
-    # Get all edges
-    edges = [(edge.source, edge.target, edge.label) for edge in graph.edges]
-
-    # Verify bidirectional handoff edges without labels
-    assert ("orchestrator_agent", "hr_agent", None) in edges
-    assert ("hr_agent", "orchestrator_agent", None) in edges
-
-    assert ("orchestrator_agent", "procurement_agent", None) in edges
-    assert ("procurement_agent", "orchestrator_agent", None) in edges
-
-    assert ("orchestrator_agent", "policy_agent", None) in edges
-    assert ("policy_agent", "orchestrator_agent", None) in edges
-
+    assert graph.node_by_id[node_id].type == expected_type
 
-def test_multi_layer_agent_tool_edges():
-    """Test that bidirectional tool edges exist for aggregated tools nodes without labels."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
 
-    # Get all edges
-    edges = [(edge.source, edge.target, edge.label) for edge in graph.edges]
+@pytest.mark.parametrize(("source", "target", "label"), EXPECTED_EDGES)
+def test_multi_layer_agent_edges(
+    graph: IndexedGraph, source: str, target: str, label: str | None
+):
+    """Test that handoff, tool and control flow edges are correctly created."""
+    assert (source, target, label) in graph.edge_set
 
-    # Verify bidirectional edges to/from aggregated tools nodes without labels
-    assert ("hr_agent", "hr_agent_tools", None) in edges
-    assert ("hr_agent_tools", "hr_agent", None) in edges
 
-    assert ("procurement_agent", "procurement_agent_tools", None) in edges
-    assert ("procurement_agent_tools", "procurement_agent", None) in edges
-
-    assert ("policy_agent", "policy_agent_tools", None) in edges
-    assert ("policy_agent_tools", "policy_agent", None) in edges
-
-
-def test_multi_layer_agent_control_edges():
-    """Test that control flow edges (start/end) are correctly created."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
-    # Get all edges
-    edges = [(edge.source, edge.target, edge.label) for edge in graph.edges]
-
-    # Verify start edge to orchestrator
-    assert ("__start__", "orchestrator_agent", "input") in edges
-
-    # Verify end edge from orchestrator
-    assert ("orchestrator_agent", "__end__", "output") in edges
-
-
-def test_multi_layer_agent_no_circular_references():
+def test_multi_layer_agent_no_circular_references(graph: IndexedGraph):
     """Test that the graph doesn't create circular references for the same agent."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
     # Count occurrences of each agent in nodes
-    node_counts: dict[str, int] = {}
-    for node in graph.nodes:
-        node_counts[node.id] = node_counts.get(node.id, 0) + 1
+    node_counts = Counter(node.id for node in graph.nodes)
+
+    # No node ID should be duplicated
+    assert len(node_counts) == len(graph.nodes)
 
     # Each agent should appear exactly once
     assert node_counts["orchestrator_agent"] == 1
@@ -291,10 +303,9 @@ def test_multi_layer_agent_no_circular_references():
     assert node_counts["policy_agent"] == 1
 
 
-def test_multi_layer_agent_entrypoints_schema():
+def test_multi_layer_agent_entrypoints_schema(multi_layer_agent: Agent):
     """Test that entrypoints schema is correctly extracted."""
-    agent = create_multi_layer_agent()
-    schema = get_entrypoints_schema(agent)
+    schema = get_entrypoints_schema(multi_layer_agent)
 
     # Verify input schema (default messages format)
     assert "input" in schema
@@ -311,11 +322,8 @@ def test_multi_layer_agent_entrypoints_schema():
     assert "result" in schema["output"]["required"]
 
 
-def test_multi_layer_agent_edge_count():
+def test_multi_layer_agent_edge_count(graph: IndexedGraph):
     """Test that the total number of edges is correct."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
     # Count expected edges:
     # - 2 control edges (start -> orchestrator, orchestrator -> end)
     # - 6 handoff edges (3 agents * 2 bidirectional edges each)
@@ -324,49 +332,22 @@ def test_multi_layer_agent_edge_count():
     assert len(graph.edges) == 14
 
 
-def test_multi_layer_agent_tools_metadata():
+@pytest.mark.parametrize(("node_id", "tool_names"), EXPECTED_TOOL_NAMES)
+def test_multi_layer_agent_tools_metadata(
+    graph: IndexedGraph, node_id: str, tool_names: list[str]
+):
     """Test that tools nodes have correct metadata with tool_names and tool_count."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
-
-    # Create a mapping of node ID to metadata
-    node_metadata = {node.id: node.metadata for node in graph.nodes}
-
-    # Verify HR agent tools metadata
-    hr_tools_metadata = node_metadata["hr_agent_tools"]
-    assert hr_tools_metadata is not None
-    assert "tool_names" in hr_tools_metadata
-    assert "tool_count" in hr_tools_metadata
-    assert hr_tools_metadata["tool_count"] == 3
-    assert "check_employee_benefits" in hr_tools_metadata["tool_names"]
-    assert "submit_leave_request" in hr_tools_metadata["tool_names"]
-    assert "get_salary_info" in hr_tools_metadata["tool_names"]
-
-    # Verify procurement agent tools metadata
-    procurement_tools_metadata = node_metadata["procurement_agent_tools"]
-    assert procurement_tools_metadata is not None
-    assert "tool_names" in procurement_tools_metadata
-    assert "tool_count" in procurement_tools_metadata
-    assert procurement_tools_metadata["tool_count"] == 3
-    assert "create_purchase_order" in procurement_tools_metadata["tool_names"]
-    assert "check_budget_availability" in procurement_tools_metadata["tool_names"]
-    assert "track_order_status" in procurement_tools_metadata["tool_names"]
-
-    # Verify policy agent tools metadata
-    policy_tools_metadata = node_metadata["policy_agent_tools"]
-    assert policy_tools_metadata is not None
-    assert "tool_names" in policy_tools_metadata
-    assert "tool_count" in policy_tools_metadata
-    assert policy_tools_metadata["tool_count"] == 2
-    assert "get_company_policy" in policy_tools_metadata["tool_names"]
-    assert "check_compliance_status" in policy_tools_metadata["tool_names"]
-
-
-def test_multi_layer_agent_no_subgraphs():
-    """Test that OpenAI agents are represented as flat nodes without subgraphs."""
-    agent = create_multi_layer_agent()
-    graph = get_agent_schema(agent)
+    tools_metadata = graph.node_by_id[node_id].metadata
+    assert tools_metadata is not None
+    assert "tool_names" in tools_metadata
+    assert "tool_count" in tools_metadata
+    assert tools_metadata["tool_count"] == len(tool_names)
+    for tool_name in tool_names:
+        assert tool_name in tools_metadata["tool_names"]
+
 
+def test_multi_layer_agent_no_subgraphs(graph: IndexedGraph):
+    """Test that OpenAI agents are represented as flat nodes without subgraphs."""
     # Verify all nodes have None subgraph (flat structure)
     for node in graph.nodes:
         assert node.subgraph is None
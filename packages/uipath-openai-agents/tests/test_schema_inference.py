@@ -1,5 +1,8 @@
 """Tests for parameter inference from type annotations."""
 
+from typing import Any
+
+import pytest
 from agents import Agent
 from pydantic import BaseModel
 
@@ -14,23 +17,40 @@ class OutputModel(BaseModel):
     confidence: float
 
 
-# Test agent with output_type (native OpenAI Agents pattern)
-agent_with_output_type = Agent(
-    name="test_agent_with_output",
-    instructions="Test agent with output_type",
-    output_type=OutputModel,
-)
+@pytest.fixture(scope="module")
+def agent_with_output_type() -> Agent:
+    """Test agent with output_type (native OpenAI Agents pattern)."""
+    return Agent(
+        name="test_agent_with_output",
+        instructions="Test agent with output_type",
+        output_type=OutputModel,
+    )
+
+
+@pytest.fixture(scope="module")
+def test_agent() -> Agent:
+    """Test agent without output_type."""
+    return Agent(
+        name="test_agent",
+        instructions="Test agent for schema inference",
+    )
+
+
+@pytest.fixture(scope="module")
+def output_type_schema(agent_with_output_type: Agent) -> dict[str, Any]:
+    """Entrypoints schema of the agent with output_type, extracted once."""
+    return get_entrypoints_schema(agent_with_output_type)
+
 
-# Test agent without output_type
-test_agent = Agent(
-    name="test_agent",
-    instructions="Test agent for schema inference",
-)
+@pytest.fixture(scope="module")
+def plain_agent_schema(test_agent: Agent) -> dict[str, Any]:
+    """Entrypoints schema of the agent without output_type, extracted once."""
+    return get_entrypoints_schema(test_agent)
 
 
-def test_schema_inference_from_agent_output_type():
+def test_schema_inference_from_agent_output_type(output_type_schema: dict[str, Any]):
     """Test that output schema is correctly inferred from agent's output_type."""
-    schema = get_entrypoints_schema(agent_with_output_type)
+    schema = output_type_schema
 
     # Check input schema - should be default messages format
     assert "input" in schema
@@ -56,9 +76,9 @@ def test_schema_inference_from_agent_output_type():
     assert schema["output"].get("title") == "OutputModel"
 
 
-def test_schema_fallback_without_types():
+def test_schema_fallback_without_types(plain_agent_schema: dict[str, Any]):
     """Test that schemas fall back to defaults when no types are provided."""
-    schema = get_entrypoints_schema(test_agent)
+    schema = plain_agent_schema
 
     # Should use default messages-based input schema
     assert "input" in schema
@@ -69,9 +89,9 @@ def test_schema_fallback_without_types():
     assert "result" in schema["output"]["properties"]
 
 
-def test_schema_with_plain_agent():
+def test_schema_with_plain_agent(plain_agent_schema: dict[str, Any]):
     """Test schema extraction with a plain agent."""
-    schema = get_entrypoints_schema(test_agent)
+    schema = plain_agent_schema
 
     # Should use default messages input
     assert "input" in schema